@@ -5,13 +5,13 @@ from typing import Any
 from tmock.matchers.base import Matcher
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RecordedArgument:
     name: str
     value: Any
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CallRecord(ABC):
     name: str
     arguments: tuple[RecordedArgument, ...]
@@ -22,20 +22,20 @@ class CallRecord(ABC):
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MethodCallRecord(CallRecord):
     def format_call(self) -> str:
         args_str = ", ".join(f"{arg.name}={_format_value(arg.value)}" for arg in self.arguments)
         return f"{self.name}({args_str})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class GetterCallRecord(CallRecord):
     def format_call(self) -> str:
         return f"get {self.name}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SetterCallRecord(CallRecord):
     def format_call(self) -> str:
         value = self.arguments[0].value if self.arguments else "?"
@@ -1,8 +1,12 @@
 import dataclasses
+import sys
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from inspect import Parameter, Signature, iscoroutinefunction, signature
-from typing import Any, Callable, ClassVar, Type, get_origin, get_type_hints
+from inspect import Parameter, Signature, iscoroutinefunction, isfunction, signature, unwrap
+from types import MappingProxyType
+from typing import Annotated, Any, Callable, ClassVar, ForwardRef, Type, get_args, get_origin, get_type_hints
 
 
 class FieldSource(Enum):
@@ -15,7 +19,7 @@ class FieldSource(Enum):
     EXTRA = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldSchema:
     """Unified schema for any mockable field."""
 
@@ -25,21 +29,23 @@ class FieldSchema:
     source: FieldSource
 
 
-@dataclass
+@dataclass(slots=True)
 class ClassSchema:
     """Holds introspected metadata about a class's members."""
 
-    method_signatures: dict[str, Signature] = field(default_factory=dict)
-    fields: dict[str, FieldSchema] = field(default_factory=dict)
-    class_or_static: set[str] = field(default_factory=set)
-    async_methods: set[str] = field(default_factory=set)
+    method_signatures: Mapping[str, Signature] = field(default_factory=dict)
+    fields: Mapping[str, FieldSchema] = field(default_factory=dict)
+    class_or_static: frozenset[str] = frozenset()
+    async_methods: frozenset[str] = frozenset()
+    magic_methods: frozenset[str] = frozenset()
 
 
 class FieldDiscovery:
     """Discovers mockable fields from various class types."""
 
-    def __init__(self, cls: Type[Any]):
+    def __init__(self, cls: Type[Any], members: dict[str, tuple[type, Any]] | None = None):
         self._cls = cls
+        self._members = members if members is not None else _class_members(cls)
 
     def discover_all(self) -> dict[str, FieldSchema]:
         """Discover all fields, with earlier sources taking precedence."""
@@ -51,14 +57,14 @@ class FieldDiscovery:
         return result
 
     def _merge(self, target: dict[str, FieldSchema], discovered: dict[str, FieldSchema]) -> None:
-        """Merge discovered fields, skipping those already present."""
+        """Merge discovered fields, skipping those already present. Names are interned for pointer-equal lookups."""
         for name, field_schema in discovered.items():
             if name not in target:
-                target[name] = field_schema
+                target[sys.intern(name)] = field_schema
 
     def _discover_pydantic_fields(self) -> dict[str, FieldSchema]:
         """Discover fields from Pydantic models (v2)."""
-        if not hasattr(self._cls, "__pydantic_complete__"):
+        if not _is_pydantic_model(self._cls):
             return {}
 
         result: dict[str, FieldSchema] = {}
@@ -104,20 +110,20 @@ class FieldDiscovery:
         """Discover @property descriptors."""
         result: dict[str, FieldSchema] = {}
 
-        for name in dir(self._cls):
+        properties = {name: attr for name, (_, attr) in self._members.items() if isinstance(attr, property)}
+        for name in sorted(properties):
             if name.startswith("_"):
                 continue
 
-            raw_attr = _get_raw_attribute(self._cls, name)
-            if isinstance(raw_attr, property):
-                getter_sig = self._extract_property_getter_signature(raw_attr.fget)
-                setter_sig = self._extract_property_setter_signature(raw_attr.fset) if raw_attr.fset else None
-                result[name] = FieldSchema(
-                    name=name,
-                    getter_signature=getter_sig,
-                    setter_signature=setter_sig,
-                    source=FieldSource.PROPERTY,
-                )
+            raw_attr = properties[name]
+            getter_sig = self._extract_property_getter_signature(raw_attr.fget)
+            setter_sig = self._extract_property_setter_signature(raw_attr.fset) if raw_attr.fset else None
+            result[name] = FieldSchema(
+                name=name,
+                getter_signature=getter_sig,
+                setter_signature=setter_sig,
+                source=FieldSource.PROPERTY,
+            )
 
         return result
 
@@ -133,7 +139,7 @@ class FieldDiscovery:
         for name, annotation in hints.items():
             if name.startswith("_"):
                 continue
-            if get_origin(annotation) is ClassVar:
+            if getattr(annotation, "__origin__", None) is ClassVar:
                 continue
             result[name] = self._create_schema(
                 name=name,
@@ -152,25 +158,17 @@ class FieldDiscovery:
         source: FieldSource,
     ) -> FieldSchema:
         """Create a FieldSchema with synthetic getter/setter signatures."""
-        getter_sig = Signature(return_annotation=annotation)
-
-        if has_setter:
-            value_param = Parameter("value", Parameter.POSITIONAL_OR_KEYWORD, annotation=annotation)
-            setter_sig = Signature(parameters=[value_param], return_annotation=type(None))
-        else:
-            setter_sig = None
-
         return FieldSchema(
             name=name,
-            getter_signature=getter_sig,
-            setter_signature=setter_sig,
+            getter_signature=build_getter_signature(annotation),
+            setter_signature=build_setter_signature(annotation) if has_setter else None,
             source=source,
         )
 
     def _extract_property_getter_signature(self, getter: Any) -> Signature:
         """Creates a signature for a property getter (no params, just return type)."""
         if getter is None:
-            return Signature(return_annotation=Signature.empty)
+            return build_getter_signature(Signature.empty)
 
         try:
             hints = get_type_hints(getter)
@@ -178,122 +176,255 @@ class FieldDiscovery:
         except Exception:
             return_type = Signature.empty
 
-        return Signature(return_annotation=return_type)
+        return build_getter_signature(return_type)
 
     def _extract_property_setter_signature(self, setter: Any) -> Signature:
         """Creates a signature for a property setter (one 'value' param, returns None)."""
         value_type: Any = Signature.empty
-        try:
-            hints = get_type_hints(setter)
-            # Get the first non-return hint (the value parameter, regardless of its name)
-            for param_name, param_type in hints.items():
-                if param_name != "return":
-                    value_type = param_type
-                    break
-        except Exception:
-            pass
-
-        value_param = Parameter("value", Parameter.POSITIONAL_OR_KEYWORD, annotation=value_type)
-        return Signature(parameters=[value_param], return_annotation=type(None))
-
-
-ALLOWED_MAGIC_METHODS = {
-    "__call__",
-    "__enter__",
-    "__exit__",
-    "__aenter__",
-    "__aexit__",
-    "__getitem__",
-    "__setitem__",
-    "__delitem__",
-    "__iter__",
-    "__next__",
-    "__aiter__",
-    "__anext__",
-    "__len__",
-    "__contains__",
-    "__bool__",
-    "__hash__",
-    "__eq__",
-    "__ne__",
-    "__lt__",
-    "__le__",
-    "__gt__",
-    "__ge__",
-    "__str__",
-    "__repr__",
-    "__format__",
-}
+        value_name = setter_value_parameter_name(setter)
+        if value_name is not None:
+            try:
+                value_type = get_type_hints(setter).get(value_name, Signature.empty)
+            except Exception:
+                pass
+
+        return build_setter_signature(value_type)
+
+
+def _is_pydantic_model(cls: Type[Any]) -> bool:
+    """Check for a pydantic v2 model without importing pydantic (an optional dependency)."""
+    pydantic = sys.modules.get("pydantic")
+    base_model = getattr(pydantic, "BaseModel", None)
+    return base_model is not None and issubclass(cls, base_model)
+
+
+def setter_value_parameter_name(setter: Any) -> str | None:
+    """Return the name of a property setter's value parameter (the one after 'self'), if it can be determined.
+
+    Decorated setters are unwrapped (via __wrapped__) first, so the name comes from the original function.
+    """
+    try:
+        setter = unwrap(setter)
+    except ValueError:
+        return None
+    code = getattr(setter, "__code__", None)
+    if code is None or code.co_argcount < 2:
+        return None
+    name: str = code.co_varnames[1]
+    return name
+
+
+# Untyped class variables and properties are common; share their (immutable) signatures
+_ANY_GETTER_SIGNATURE = Signature(return_annotation=Any)
+_ANY_SETTER_SIGNATURE = Signature(
+    parameters=[Parameter("value", Parameter.POSITIONAL_OR_KEYWORD, annotation=Any)],
+    return_annotation=type(None),
+)
+
+
+def build_getter_signature(return_type: Any) -> Signature:
+    """Return a getter signature (no params) returning return_type."""
+    if return_type is Any:
+        return _ANY_GETTER_SIGNATURE
+    return Signature(return_annotation=return_type)
+
+
+def build_setter_signature(value_type: Any) -> Signature:
+    """Return a setter signature (one 'value' param of value_type, returns None)."""
+    if value_type is Any:
+        return _ANY_SETTER_SIGNATURE
+    return Signature(
+        parameters=[Parameter("value", Parameter.POSITIONAL_OR_KEYWORD, annotation=value_type)],
+        return_annotation=type(None),
+    )
+
+
+ALLOWED_MAGIC_METHODS = frozenset(
+    {
+        "__call__",
+        "__enter__",
+        "__exit__",
+        "__aenter__",
+        "__aexit__",
+        "__getitem__",
+        "__setitem__",
+        "__delitem__",
+        "__iter__",
+        "__next__",
+        "__aiter__",
+        "__anext__",
+        "__len__",
+        "__contains__",
+        "__bool__",
+        "__hash__",
+        "__eq__",
+        "__ne__",
+        "__lt__",
+        "__le__",
+        "__gt__",
+        "__ge__",
+        "__str__",
+        "__repr__",
+        "__format__",
+    }
+)
+
+
+NamespaceNames = tuple[tuple[dict[str, Any], frozenset[str]], ...]
+
+# Bounded: schemas reference their class (e.g. through resolved annotations), so entries keep it alive
+_SCHEMA_CACHE_SIZE = 256
+_SCHEMA_CACHE: OrderedDict[type, tuple[tuple[Any, ...], dict[tuple[str, ...], tuple[ClassSchema, NamespaceNames]]]] = (
+    OrderedDict()
+)
 
 
 def introspect_class(cls: Type[Any], extra_fields: list[str] | None = None) -> ClassSchema:
-    """Analyzes a class and extracts metadata about its members."""
-    schema = ClassSchema()
+    """Analyzes a class and extracts metadata about its members.
 
+    Results are cached per (class, extra_fields) for recently introspected classes, and rebuilt once
+    the class or one of its bases is modified (e.g. patched). The returned schema is shared and read-only.
+    """
+    snapshot = _class_snapshot(cls)
+    try:
+        entry = _SCHEMA_CACHE.get(cls)
+    except TypeError:  # Unhashable, e.g. a metaclass defining __eq__ without __hash__
+        return _build_class_schema(cls, extra_fields)
+    if entry is None or not _snapshots_equal(entry[0], snapshot):
+        entry = _SCHEMA_CACHE[cls] = (snapshot, {})
+        if len(_SCHEMA_CACHE) > _SCHEMA_CACHE_SIZE:
+            _SCHEMA_CACHE.popitem(last=False)
+    else:
+        _SCHEMA_CACHE.move_to_end(cls)
+
+    per_class = entry[1]
+    key = tuple(extra_fields) if extra_fields else ()
+    cached = per_class.get(key)
+    if cached is not None and namespace_names_unchanged(cached[1]):
+        return cached[0]
+    schema = _build_class_schema(cls, extra_fields)
+    per_class[key] = (schema, _forward_ref_namespaces(cls))
+    return schema
+
+
+def _class_snapshot(cls: Type[Any]) -> tuple[Any, ...]:
+    """Capture what a schema is derived from: the MRO and the contents of each class namespace."""
+    mro = cls.__mro__
+    return mro, tuple(tuple(klass.__dict__.items()) for klass in mro)
+
+
+def _snapshots_equal(a: tuple[Any, ...], b: tuple[Any, ...]) -> bool:
+    # Tuple comparison checks identity first, so unchanged members never reach a user-defined __eq__
+    try:
+        return bool(a == b)
+    except Exception:
+        return False
+
+
+def _forward_ref_namespaces(cls: Type[Any]) -> NamespaceNames:
+    """If cls or its members are annotated with forward references, the module namespaces they resolve in.
+
+    A cached schema is rebuilt once a name is added to or removed from one of them, as that may change what
+    the references resolve to.
+    """
+    if not _has_forward_refs(cls):
+        return ()
+    modules = (sys.modules.get(klass.__module__) for klass in cls.__mro__ if klass.__module__ != "builtins")
+    return capture_namespace_names(module.__dict__ for module in modules if module is not None)
+
+
+def _has_forward_refs(cls: Type[Any]) -> bool:
+    annotation_dicts = [klass.__dict__.get("__annotations__", {}) for klass in cls.__mro__]
+    for _, raw_attr in _class_members(cls).values():
+        accessors = (raw_attr.fget, raw_attr.fset) if isinstance(raw_attr, property) else (raw_attr,)
+        annotation_dicts.extend(accessor.__annotations__ for accessor in accessors if isfunction(accessor))
+    return any(
+        _annotation_needs_resolution(annotation)
+        for annotations in annotation_dicts
+        for annotation in annotations.values()
+    )
+
+
+def capture_namespace_names(namespaces: Iterable[dict[str, Any]]) -> NamespaceNames:
+    """Record the names currently bound in each namespace (deduplicated), for namespace_names_unchanged()."""
+    unique = {id(namespace): namespace for namespace in namespaces}
+    return tuple((namespace, frozenset(namespace)) for namespace in unique.values())
+
+
+def namespace_names_unchanged(captured: NamespaceNames) -> bool:
+    """Check that no name was added to or removed from the captured namespaces since they were recorded."""
+    return all(namespace.keys() == names for namespace, names in captured)
+
+
+def _build_class_schema(cls: Type[Any], extra_fields: list[str] | None) -> ClassSchema:
     # Discover fields
-    discovery = FieldDiscovery(cls)
-    schema.fields = discovery.discover_all()
-    _apply_extra_fields_if_not_discovered(extra_fields, schema)
+    members = _class_members(cls)
+    fields = FieldDiscovery(cls, members).discover_all()
+    _apply_extra_fields_if_not_discovered(extra_fields, fields)
 
     # Discover methods and class/static members
-    for name in dir(cls):
+    method_signatures: dict[str, Signature] = {}
+    class_or_static: set[str] = set()
+    async_methods: set[str] = set()
+    magic_methods: set[str] = set()
+    for name in sorted(members):
         is_magic_allowed = name in ALLOWED_MAGIC_METHODS
-        if (name.startswith("_") and not is_magic_allowed) or name in schema.fields:
+        if (name.startswith("_") and not is_magic_allowed) or name in fields:
             continue
 
-        raw_attr = _get_raw_attribute(cls, name)
+        owner, raw_attr = members[name]
         if raw_attr is None:
             continue
 
         # Skip magic methods that are just the default object implementation
-        if is_magic_allowed and _default_impl_is_inherited_from_object(cls, name):
+        if is_magic_allowed and owner is object:
             continue
 
         if isinstance(raw_attr, (classmethod, staticmethod)):
-            schema.class_or_static.add(name)
+            class_or_static.add(name)
         elif callable(raw_attr) and not isinstance(raw_attr, property):
-            schema.method_signatures[name] = _extract_instance_method_signature(raw_attr)
+            method_signatures[sys.intern(name)] = _extract_instance_method_signature(raw_attr)
             if iscoroutinefunction(raw_attr):
-                schema.async_methods.add(name)
-
-    return schema
-
-
-def _default_impl_is_inherited_from_object(cls: Type[Any], name: str) -> bool:
-    """Returns True if the attribute is resolved from the 'object' class directly."""
-    for base in cls.__mro__:
-        if name in base.__dict__:
-            return base is object
-    return False
+                async_methods.add(name)
+            if is_magic_allowed:
+                magic_methods.add(name)
+
+    # Schemas are cached and shared between mocks, so expose everything read-only
+    return ClassSchema(
+        method_signatures=MappingProxyType(method_signatures),
+        fields=MappingProxyType(fields),
+        class_or_static=frozenset(class_or_static),
+        async_methods=frozenset(async_methods),
+        magic_methods=frozenset(magic_methods),
+    )
 
 
-def _apply_extra_fields_if_not_discovered(extra_fields, schema):
+def _apply_extra_fields_if_not_discovered(extra_fields, fields):
     if not extra_fields:
         return
     for name in extra_fields:
-        if name not in schema.fields:
-            schema.fields[name] = _create_extra_field_schema(name)
+        if name not in fields:
+            fields[name] = _create_extra_field_schema(name)
 
 
 def _create_extra_field_schema(name: str) -> FieldSchema:
     """Create a FieldSchema for an extra field with no type info."""
-    getter_sig = Signature(return_annotation=Any)
-    value_param = Parameter("value", Parameter.POSITIONAL_OR_KEYWORD, annotation=Any)
-    setter_sig = Signature(parameters=[value_param], return_annotation=type(None))
     return FieldSchema(
         name=name,
-        getter_signature=getter_sig,
-        setter_signature=setter_sig,
+        getter_signature=build_getter_signature(Any),
+        setter_signature=build_setter_signature(Any),
         source=FieldSource.EXTRA,
     )
 
 
-def _get_raw_attribute(cls: Type[Any], name: str) -> Any:
-    """Retrieves the raw attribute from the class hierarchy, bypassing descriptors."""
+def _class_members(cls: Type[Any]) -> dict[str, tuple[type, Any]]:
+    """Map each attribute name visible on cls to (defining class, raw attribute), in a single MRO pass."""
+    members: dict[str, tuple[type, Any]] = {}
     for klass in cls.__mro__:
-        if name in klass.__dict__:
-            return klass.__dict__[name]
-    return None
+        for name, value in klass.__dict__.items():
+            if name not in members:
+                members[name] = (klass, value)
+    return members
 
 
 def _extract_instance_method_signature(method: Any) -> Signature:
@@ -320,6 +451,9 @@ def resolve_forward_refs(func: Callable[..., Any], sig: Signature) -> Signature:
         A new Signature with forward references resolved to actual types.
         If resolution fails, returns the original signature unchanged.
     """
+    if not _signature_needs_resolution(sig):
+        return sig
+
     try:
         hints = get_type_hints(func)
     except Exception:
@@ -334,3 +468,28 @@ def resolve_forward_refs(func: Callable[..., Any], sig: Signature) -> Signature:
 
     return_annotation = hints.get("return", sig.return_annotation)
     return sig.replace(parameters=new_params, return_annotation=return_annotation)
+
+
+def has_unresolved_forward_refs(sig: Signature) -> bool:
+    """Check whether any annotation in the signature is still a string/ForwardRef, i.e. failed to resolve."""
+    if isinstance(sig.return_annotation, (str, ForwardRef)):
+        return True
+    return any(isinstance(param.annotation, (str, ForwardRef)) for param in sig.parameters.values())
+
+
+def _signature_needs_resolution(sig: Signature) -> bool:
+    """Check whether any annotation in the signature would be changed by get_type_hints."""
+    if _annotation_needs_resolution(sig.return_annotation):
+        return True
+    return any(_annotation_needs_resolution(param.annotation) for param in sig.parameters.values())
+
+
+def _annotation_needs_resolution(annotation: Any) -> bool:
+    """Check for string/ForwardRef annotations (including nested ones like list["Node"]) and Annotated."""
+    if isinstance(annotation, (str, ForwardRef)):
+        return True
+    if isinstance(annotation, (list, tuple)):
+        return any(_annotation_needs_resolution(arg) for arg in annotation)
+    if get_origin(annotation) is Annotated:
+        return True
+    return any(_annotation_needs_resolution(arg) for arg in get_args(annotation))
@@ -1,8 +1,11 @@
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, Optional
 
+from tmock.exceptions import TMockStubbingError
+
 if TYPE_CHECKING:
-    from tmock.interceptor import Interceptor
+    from tmock.call_record import CallRecord
+    from tmock.interceptor import DslState, Interceptor
 
 
 @dataclass
@@ -13,3 +16,23 @@ class FieldRef:
     name: str
     getter_interceptor: "Interceptor"
     setter_interceptor: Optional["Interceptor"]
+
+
+def capture_field_get(dsl: "DslState", field_ref: Any, dsl_name: str) -> tuple["Interceptor", "CallRecord"]:
+    """Record a getter pattern for given().get()/verify().get() and return it for the terminal builder."""
+    if not isinstance(field_ref, FieldRef):
+        raise TMockStubbingError(f"get() expects a field access, e.g. {dsl_name}().get(mock.field)")
+    # Call the getter interceptor to record the pattern
+    field_ref.getter_interceptor()
+    return dsl.begin_terminal()
+
+
+def capture_field_set(dsl: "DslState", field_ref: Any, value: Any, dsl_name: str) -> tuple["Interceptor", "CallRecord"]:
+    """Record a setter pattern for given().set()/verify().set() and return it for the terminal builder."""
+    if not isinstance(field_ref, FieldRef):
+        raise TMockStubbingError(f"set() expects a field access, e.g. {dsl_name}().set(mock.field, value)")
+    if field_ref.setter_interceptor is None:
+        raise TMockStubbingError(f"Field '{field_ref.name}' is read-only and cannot be set")
+    # Call the setter interceptor with the value to record the pattern
+    field_ref.setter_interceptor(value)
+    return dsl.begin_terminal()
@@ -1,9 +1,12 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
 from contextvars import ContextVar
 from dataclasses import dataclass
 from enum import Enum, auto
+from functools import cached_property
 from inspect import Parameter, Signature
-from typing import Any, Callable, TypeVar, overload
+from typing import TYPE_CHECKING, Any, Callable, ForwardRef, TypeVar, overload
 
 from typeguard import TypeCheckError, check_type
 
@@ -18,7 +21,8 @@ from tmock.call_record import (
 from tmock.exceptions import TMockStubbingError, TMockUnexpectedCallError, TMockVerificationError
 from tmock.matchers.base import Matcher
 
-T = TypeVar("T")
+if TYPE_CHECKING:
+    T = TypeVar("T")
 
 
 class DslType(Enum):
@@ -32,7 +36,7 @@ class DslPhase(Enum):
     AWAITING_TERMINAL = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class BoundArgument:
     name: str
     value: Any
@@ -43,7 +47,12 @@ class CallArguments:
     """Container for accessing call arguments by name."""
 
     def __init__(self, arguments: tuple[RecordedArgument, ...]):
-        self._args = {arg.name: arg.value for arg in arguments}
+        self._arguments = arguments
+
+    @cached_property
+    def _args(self) -> dict[str, Any]:
+        # Built on first access: returns()/raises() stubs never read their arguments
+        return {arg.name: arg.value for arg in self._arguments}
 
     @overload
     def get_by_name(self, name: str) -> Any: ...
@@ -77,9 +86,27 @@ class CallArguments:
         return value
 
 
+def _positional_parameters(signature: Signature) -> tuple[Parameter, ...] | None:
+    """Return the parameters if all of them can be passed positionally, else None."""
+    params = tuple(signature.parameters.values())
+    if all(param.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD) for param in params):
+        return params
+    return None
+
+
+def _is_unresolved_forward_ref(annotation: Any) -> bool:
+    """Signatures are resolved up front (see resolve_forward_refs), so a string left here could not be resolved.
+
+    Skipping it avoids typeguard re-evaluating the reference and warning on every validation.
+    """
+    return isinstance(annotation, (str, ForwardRef))
+
+
 class Stub(ABC):
     """Base class for all stub behaviors."""
 
+    __slots__ = ("call_record",)
+
     def __init__(self, call_record: CallRecord):
         self.call_record = call_record
 
@@ -92,6 +119,8 @@ class Stub(ABC):
 class ReturnsStub(Stub):
     """Stub that returns a value."""
 
+    __slots__ = ("value",)
+
     def __init__(self, call_record: CallRecord, value: Any):
         super().__init__(call_record)
         self.value = value
@@ -103,6 +132,8 @@ class ReturnsStub(Stub):
 class RaisesStub(Stub):
     """Stub that raises an exception."""
 
+    __slots__ = ("exception",)
+
     def __init__(self, call_record: CallRecord, exception: BaseException):
         super().__init__(call_record)
         self.exception = exception
@@ -114,6 +145,8 @@ class RaisesStub(Stub):
 class RunsStub(Stub):
     """Stub that runs a custom action."""
 
+    __slots__ = ("action",)
+
     def __init__(self, call_record: CallRecord, action: Callable[[CallArguments], Any]):
         super().__init__(call_record)
         self.action = action
@@ -125,11 +158,15 @@ class RunsStub(Stub):
 class Interceptor(ABC):
     """Base class for all interceptors (methods, getters, setters)."""
 
+    __slots__ = ("_name", "_signature", "_positional_params", "_class_name", "_calls", "_calls_version", "_stubs")
+
     def __init__(self, name: str, signature: Signature, class_name: str):
         self._name = name
         self._signature = signature
+        self._positional_params = _positional_parameters(signature)
         self._class_name = class_name
         self._calls: list[CallRecord] = []
+        self._calls_version = 0
         self._stubs: list[Stub] = []
 
     @abstractmethod
@@ -137,11 +174,26 @@ class Interceptor(ABC):
         """Create the appropriate CallRecord subclass for this interceptor type."""
         raise NotImplementedError
 
+    @property
+    def calls_version(self) -> int:
+        """Counter that changes whenever the recorded calls change."""
+        return self._calls_version
+
     def pop_last_call(self) -> CallRecord:
+        self._calls_version += 1
         return self._calls.pop()
 
-    def count_matching_calls(self, expected: CallRecord) -> int:
-        return sum(1 for call in self._calls if pattern_matches_call(expected, call))
+    def count_matching_calls(self, expected: CallRecord, limit: int | None = None) -> int:
+        """Count recorded calls matching expected, stopping early once limit matches are found."""
+        if limit is not None and limit <= 0:
+            return 0
+        count = 0
+        for call in self._calls:
+            if pattern_matches_call(expected, call):
+                count += 1
+                if count == limit:
+                    break
+        return count
 
     def add_stub(self, stub: Stub) -> None:
         """Add a stub to this method."""
@@ -150,6 +202,7 @@ class Interceptor(ABC):
     def reset_interactions(self) -> None:
         """Clear all recorded calls."""
         self._calls.clear()
+        self._calls_version += 1
 
     def reset_behaviors(self) -> None:
         """Clear all stubs."""
@@ -162,7 +215,17 @@ class Interceptor(ABC):
 
     def validate_return_type(self, value: Any) -> None:
         """Validate that a value matches the method's return type annotation."""
-        self._validate_return_type(value)
+        return_annotation = self._signature.return_annotation
+        if return_annotation is Signature.empty or _is_unresolved_forward_ref(return_annotation):
+            return
+        if type(value) is return_annotation:  # exact class matches always pass; skip typeguard
+            return
+        try:
+            check_type(value, return_annotation)
+        except TypeCheckError:
+            raise TMockStubbingError(
+                f"Invalid return type for {self._name}, expected {return_annotation}, got {type(value).__name__}"
+            )
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         dsl = get_dsl_state()
@@ -176,9 +239,13 @@ class Interceptor(ABC):
             dsl.record_dsl_call(self, record)
             return None
 
-        self._calls.append(record)
+        self._record_call(record)
         return self._find_stub(record)
 
+    def _record_call(self, record: CallRecord) -> None:
+        self._calls.append(record)
+        self._calls_version += 1
+
     def _find_stub(self, record: CallRecord) -> Any:
         # Iterate in reverse so later stubs take precedence
         for stub in reversed(self._stubs):
@@ -188,6 +255,17 @@ class Interceptor(ABC):
         raise TMockUnexpectedCallError(f"No matching behavior defined on {self._class_name} for {record.format_call()}")
 
     def _bind_arguments(self, args: tuple[Any, ...], kwargs: dict[str, Any]) -> list[BoundArgument]:
+        params = self._positional_params
+        if params is not None and not kwargs and len(args) <= len(params):
+            # Fast path for plain positional calls; anything unusual falls through to Signature.bind
+            result = [BoundArgument(param.name, value, param.annotation) for param, value in zip(params, args)]
+            for param in params[len(args) :]:
+                if param.default is Parameter.empty:
+                    break
+                result.append(BoundArgument(param.name, param.default, param.annotation))
+            else:
+                return result
+
         try:
             bound = self._signature.bind(*args, **kwargs)
             bound.apply_defaults()
@@ -202,9 +280,10 @@ class Interceptor(ABC):
 
     def _validate_arg_types(self, bound_args: list[BoundArgument]) -> None:
         for arg in bound_args:
-            if arg.annotation is Parameter.empty:
+            if arg.annotation is Parameter.empty or _is_unresolved_forward_ref(arg.annotation):
                 continue
-            if isinstance(arg.value, Matcher):
+            # Exact class matches always pass; skip typeguard for them
+            if type(arg.value) is arg.annotation or isinstance(arg.value, Matcher):
                 continue
             try:
                 check_type(arg.value, arg.annotation)
@@ -214,21 +293,12 @@ class Interceptor(ABC):
                     f"got {type(arg.value).__name__}"
                 )
 
-    def _validate_return_type(self, value: Any) -> None:
-        return_annotation = self._signature.return_annotation
-        if return_annotation is Signature.empty:
-            return
-        try:
-            check_type(value, return_annotation)
-        except TypeCheckError:
-            raise TMockStubbingError(
-                f"Invalid return type for {self._name}, expected {return_annotation}, got {type(value).__name__}"
-            )
-
 
 class MethodInterceptor(Interceptor):
     """Interceptor for method calls."""
 
+    __slots__ = ("_is_async",)
+
     def __init__(self, name: str, signature: Signature, class_name: str, is_async: bool = False):
         super().__init__(name, signature, class_name)
         self._is_async = is_async
@@ -255,20 +325,22 @@ class MethodInterceptor(Interceptor):
         return self._sync_call(record)
 
     def _sync_call(self, record: CallRecord) -> Any:
-        self._calls.append(record)
+        self._record_call(record)
         return self._find_stub(record)
 
     async def _async_call(self, record: CallRecord) -> Any:
         # The 'async def' keyword makes this return a coroutine object.
         # The logic is identical to _sync_call, but wrapping it in async def
         # means callers must 'await' the result, matching real async method behavior.
-        self._calls.append(record)
+        self._record_call(record)
         return self._find_stub(record)
 
 
 class GetterInterceptor(Interceptor):
     """Interceptor for property getter access."""
 
+    __slots__ = ()
+
     def _create_record(self, arguments: tuple[RecordedArgument, ...]) -> CallRecord:
         return GetterCallRecord(self._name, arguments)
 
@@ -276,6 +348,8 @@ class GetterInterceptor(Interceptor):
 class SetterInterceptor(Interceptor):
     """Interceptor for property setter access."""
 
+    __slots__ = ()
+
     def _create_record(self, arguments: tuple[RecordedArgument, ...]) -> CallRecord:
         return SetterCallRecord(self._name, arguments)
 
@@ -327,10 +401,7 @@ class DslState:
 
     def reset(self) -> None:
         """Reset the state completely (for test cleanup)."""
-        self.phase = DslPhase.NONE
-        self.type = None
-        self.interceptor = None
-        self.record = None
+        self.complete()
 
     def _dsl_name(self) -> str:
         if self.type == DslType.STUBBING:
@@ -14,6 +14,9 @@ class AnyMatcher(Matcher[T]):
         self._expected_type = expected_type
 
     def matches(self, value: Any) -> bool:
+        # An exact class match is always accepted by typeguard, so skip the full check for the common case
+        if self._expected_type is Any or type(value) is self._expected_type:
+            return True
         try:
             check_type(value, self._expected_type)
             return True
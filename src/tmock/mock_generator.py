@@ -1,7 +1,9 @@
+from __future__ import annotations
+
 import inspect
-from typing import Any, Callable, Type, TypeVar, overload
+from typing import TYPE_CHECKING, Any, Callable, Type, TypeVar, overload
 
-from tmock.class_schema import ALLOWED_MAGIC_METHODS, FieldSchema, introspect_class, resolve_forward_refs
+from tmock.class_schema import FieldSchema, introspect_class, resolve_forward_refs
 from tmock.exceptions import TMockUnexpectedCallError
 from tmock.field_ref import FieldRef
 from tmock.interceptor import (
@@ -11,7 +13,8 @@ from tmock.interceptor import (
     get_dsl_state,
 )
 
-T = TypeVar("T")
+if TYPE_CHECKING:
+    T = TypeVar("T")
 
 
 def is_tmock(obj: Any) -> bool:
@@ -70,10 +73,13 @@ def _tmock_function(fn: Callable[..., Any]) -> MethodInterceptor:
 def _tmock_class(cls: Type[T], extra_fields: list[str] | None = None) -> T:
     """Implementation of class mocking."""
     schema = introspect_class(cls, extra_fields=extra_fields)
+    cls_name = cls.__name__
+    # Plain set membership for __setattr__, skipping the read-only mapping proxy around schema.fields
+    field_names = frozenset(schema.fields)
 
     class TMock(cls):  # type: ignore[valid-type, misc]
         _is_tmock = True
-        __name__ = cls.__name__
+        __name__ = cls_name
         __module__ = cls.__module__
 
         def __init__(self) -> None:
@@ -85,25 +91,19 @@ def _tmock_class(cls: Type[T], extra_fields: list[str] | None = None) -> T:
             if _is_dunder(name):
                 return object.__getattribute__(self, name)
 
-            if name in schema.class_or_static:
-                return getattr(cls, name)
-
-            if name in schema.method_signatures:
-                return _get_method_interceptor(self, name)
-
-            if name in schema.fields:
-                return _get_field_value(self, name)
-
-            raise TMockUnexpectedCallError(f"{cls.__name__} has no attribute '{name}'")
+            handler = attribute_handlers.get(name)
+            if handler is None:
+                raise TMockUnexpectedCallError(f"{cls_name} has no attribute '{name}'")
+            return handler(self, name)
 
         def __setattr__(self, name: str, value: Any) -> None:
-            if name in schema.fields:
+            if name in field_names:
                 return _set_field_value(self, name, value)
-            raise TMockUnexpectedCallError(f"{cls.__name__} has no attribute '{name}'")
+            raise TMockUnexpectedCallError(f"{cls_name} has no attribute '{name}'")
 
         def __repr__(self) -> str:
             # Fallback repr if not intercepted
-            return f"<TMock of {cls.__name__}>"
+            return f"<TMock of {cls_name}>"
 
         @staticmethod
         def _create_magic_method_wrapper(method_name: str) -> Callable[..., Any]:
@@ -117,7 +117,7 @@ def _tmock_class(cls: Type[T], extra_fields: list[str] | None = None) -> T:
         if existing := interceptors.get(name):
             return existing
         is_async = name in schema.async_methods
-        interceptors[name] = MethodInterceptor(name, schema.method_signatures[name], cls.__name__, is_async)
+        interceptors[name] = MethodInterceptor(name, schema.method_signatures[name], cls_name, is_async)
         return interceptors[name]
 
     def _get_field_value(self: TMock, name: str) -> Any:
@@ -130,7 +130,7 @@ def _tmock_class(cls: Type[T], extra_fields: list[str] | None = None) -> T:
         if existing := getters.get(name):
             return existing()
         field: FieldSchema = schema.fields[name]
-        getters[name] = GetterInterceptor(name, field.getter_signature, cls.__name__)
+        getters[name] = GetterInterceptor(name, field.getter_signature, cls_name)
         return getters[name]()
 
     def _get_or_create_getter(self: TMock, name: str) -> GetterInterceptor:
@@ -138,7 +138,7 @@ def _tmock_class(cls: Type[T], extra_fields: list[str] | None = None) -> T:
         if existing := getters.get(name):
             return existing
         field: FieldSchema = schema.fields[name]
-        getters[name] = GetterInterceptor(name, field.getter_signature, cls.__name__)
+        getters[name] = GetterInterceptor(name, field.getter_signature, cls_name)
         return getters[name]
 
     def _get_or_create_setter(self: TMock, name: str) -> SetterInterceptor | None:
@@ -148,18 +148,26 @@ def _tmock_class(cls: Type[T], extra_fields: list[str] | None = None) -> T:
         setters: dict[str, SetterInterceptor] = object.__getattribute__(self, "__field_setter_interceptors")
         if existing := setters.get(name):
             return existing
-        setters[name] = SetterInterceptor(name, field.setter_signature, cls.__name__)
+        setters[name] = SetterInterceptor(name, field.setter_signature, cls_name)
         return setters[name]
 
     def _set_field_value(self: TMock, name: str, value: Any) -> None:
         setter = _get_or_create_setter(self, name)
         if setter is None:
-            raise TMockUnexpectedCallError(f"{cls.__name__}.{name} is read-only")
+            raise TMockUnexpectedCallError(f"{cls_name}.{name} is read-only")
         setter(value)
 
-    for magic_method in ALLOWED_MAGIC_METHODS:
-        if magic_method in schema.method_signatures:
-            setattr(TMock, magic_method, TMock._create_magic_method_wrapper(magic_method))
+    def _get_class_or_static(self: TMock, name: str) -> Any:
+        return getattr(cls, name)
+
+    # One dict lookup per attribute access; later entries win, so insert in reverse precedence order
+    attribute_handlers: dict[str, Callable[[TMock, str], Any]] = {}
+    attribute_handlers.update(dict.fromkeys(schema.fields, _get_field_value))
+    attribute_handlers.update(dict.fromkeys(schema.method_signatures, _get_method_interceptor))
+    attribute_handlers.update(dict.fromkeys(schema.class_or_static, _get_class_or_static))
+
+    for magic_method in schema.magic_methods:
+        setattr(TMock, magic_method, TMock._create_magic_method_wrapper(magic_method))
 
     instance = object.__new__(TMock)
     TMock.__init__(instance)
@@ -3,9 +3,10 @@ from typing import Any, Awaitable, Callable, Generic, TypeVar, overload
 
 from tmock.call_record import CallRecord
 from tmock.exceptions import TMockStubbingError
-from tmock.field_ref import FieldRef
+from tmock.field_ref import capture_field_get, capture_field_set
 from tmock.interceptor import (
     CallArguments,
+    DslState,
     DslType,
     Interceptor,
     RaisesStub,
@@ -20,7 +21,10 @@ R = TypeVar("R")
 class StubbingBuilder(Generic[R]):
     """Builder for configuring stub behavior after .call()."""
 
-    def __init__(self, interceptor: Interceptor, record: CallRecord):
+    __slots__ = ("_dsl", "_interceptor", "_record")
+
+    def __init__(self, dsl: DslState, interceptor: Interceptor, record: CallRecord):
+        self._dsl = dsl
         self._interceptor = interceptor
         self._record = record
 
@@ -28,12 +32,12 @@ class StubbingBuilder(Generic[R]):
         """Stub the method to return the given value."""
         self._interceptor.validate_return_type(value)
         self._interceptor.add_stub(ReturnsStub(self._record, value))
-        get_dsl_state().complete()
+        self._dsl.complete()
 
     def raises(self, exception: BaseException) -> None:
         """Stub the method to raise the given exception."""
         self._interceptor.add_stub(RaisesStub(self._record, exception))
-        get_dsl_state().complete()
+        self._dsl.complete()
 
     def runs(self, action: Callable[[CallArguments], R]) -> None:
         """Stub the method to execute the given action with call arguments."""
@@ -49,12 +53,17 @@ class StubbingBuilder(Generic[R]):
             return result
 
         self._interceptor.add_stub(RunsStub(self._record, validated_action))
-        get_dsl_state().complete()
+        self._dsl.complete()
 
 
 class GivenBuilder:
     """Builder returned by given() to capture mock method calls for stubbing."""
 
+    __slots__ = ("_dsl",)
+
+    def __init__(self, dsl: DslState):
+        self._dsl = dsl
+
     @overload
     def call(self, _: Awaitable[R]) -> StubbingBuilder[R]: ...
 
@@ -67,9 +76,8 @@ class GivenBuilder:
         Usage:
             given().call(mock.method(args)).returns(value)
         """
-        dsl = get_dsl_state()
-        interceptor, record = dsl.begin_terminal()
-        return StubbingBuilder(interceptor, record)
+        interceptor, record = self._dsl.begin_terminal()
+        return StubbingBuilder(self._dsl, interceptor, record)
 
     def get(self, field_ref: Any) -> StubbingBuilder[Any]:
         """Capture a field getter pattern and return a stubbing builder.
@@ -77,13 +85,8 @@ class GivenBuilder:
         Usage:
             given().get(mock.field).returns(value)
         """
-        if not isinstance(field_ref, FieldRef):
-            raise TMockStubbingError("get() expects a field access, e.g. given().get(mock.field)")
-        dsl = get_dsl_state()
-        # Call the getter interceptor to record the pattern
-        field_ref.getter_interceptor()
-        interceptor, record = dsl.begin_terminal()
-        return StubbingBuilder(interceptor, record)
+        interceptor, record = capture_field_get(self._dsl, field_ref, "given")
+        return StubbingBuilder(self._dsl, interceptor, record)
 
     def set(self, field_ref: Any, value: Any) -> StubbingBuilder[None]:
         """Capture a field setter pattern and return a stubbing builder.
@@ -91,15 +94,8 @@ class GivenBuilder:
         Usage:
             given().set(mock.field, value).returns(None)
         """
-        if not isinstance(field_ref, FieldRef):
-            raise TMockStubbingError("set() expects a field access, e.g. given().set(mock.field, value)")
-        if field_ref.setter_interceptor is None:
-            raise TMockStubbingError(f"Field '{field_ref.name}' is read-only and cannot be set")
-        dsl = get_dsl_state()
-        # Call the setter interceptor with the value to record the pattern
-        field_ref.setter_interceptor(value)
-        interceptor, record = dsl.begin_terminal()
-        return StubbingBuilder(interceptor, record)
+        interceptor, record = capture_field_set(self._dsl, field_ref, value, "given")
+        return StubbingBuilder(self._dsl, interceptor, record)
 
 
 def given() -> GivenBuilder:
@@ -112,4 +108,4 @@ def given() -> GivenBuilder:
     """
     dsl = get_dsl_state()
     dsl.enter_dsl_mode(DslType.STUBBING)
-    return GivenBuilder()
+    return GivenBuilder(dsl)
@@ -8,20 +8,33 @@ from __future__ import annotations
 
 import importlib
 import inspect
-import typing
+import sys
+from collections import OrderedDict
 from contextlib import contextmanager
-from inspect import Parameter, Signature
+from enum import Enum, auto
+from inspect import Signature
 from types import ModuleType
-from typing import Any, ClassVar, Generator
+from typing import Any, Callable, ClassVar, Generator, get_type_hints
 from unittest import mock
 
 from typeguard import TypeCheckError, check_type
 
-from tmock.class_schema import FieldDiscovery, resolve_forward_refs
-from tmock.exceptions import TMockPatchingError
+from tmock.class_schema import (
+    build_getter_signature,
+    build_setter_signature,
+    has_unresolved_forward_refs,
+    introspect_class,
+    resolve_forward_refs,
+    setter_value_parameter_name,
+)
+from tmock.exceptions import TMockPatchingError, TMockStubbingError
 from tmock.field_ref import FieldRef
 from tmock.interceptor import GetterInterceptor, MethodInterceptor, SetterInterceptor
 
+# Bound once so each patch setup avoids the mock.patch.object attribute chain
+_patch = mock.patch
+_patch_object = mock.patch.object
+
 
 class tpatch:
     """Typed patching using stdlib mock.
@@ -53,26 +66,12 @@ class tpatch:
             with tpatch.function("test_file.get_user") as mock:
                 given().call(mock(1)).returns(User(id=1))
         """
-        if "." not in path:
-            raise TMockPatchingError(f"Invalid path '{path}'. Expected format: 'module.attribute'.")
-
-        module_path, name = path.rsplit(".", 1)
-        try:
-            module = importlib.import_module(module_path)
-        except ImportError as e:
-            raise TMockPatchingError(f"Cannot import module '{module_path}': {e}")
-
-        if not hasattr(module, name):
-            raise TMockPatchingError(f"Module '{module_path}' has no attribute '{name}'.")
-
-        original = getattr(module, name)
+        _, module_path, name, original = _resolve_path(path)
 
         if not callable(original):
             raise TMockPatchingError(f"'{name}' is not callable. Use tpatch.module_var() for variables.")
 
-        sig = inspect.signature(original)
-        sig = resolve_forward_refs(original, sig)
-        is_async = inspect.iscoroutinefunction(original)
+        sig, _, is_async = _resolved_signature(original)
 
         interceptor = MethodInterceptor(
             name=name,
@@ -81,7 +80,7 @@ class tpatch:
             is_async=is_async,
         )
 
-        with mock.patch(path, interceptor):
+        with _patch(path, interceptor):
             yield interceptor
 
     @staticmethod
@@ -102,44 +101,38 @@ class tpatch:
                 service = UserService()
                 service.save(user)
         """
-        if not hasattr(cls, name):
-            raise TMockPatchingError(f"Class '{cls.__name__}' has no attribute '{name}'.")
-
-        attr = inspect.getattr_static(cls, name)
+        cls_name = cls.__name__
+        kind, attr = _classify_attribute(cls, name)
 
-        if isinstance(attr, staticmethod):
+        if kind is _AttrKind.MISSING:
+            raise TMockPatchingError(f"Class '{cls_name}' has no attribute '{name}'.")
+        if kind is _AttrKind.STATIC_METHOD:
             raise TMockPatchingError(f"'{name}' is a staticmethod. Use tpatch.static_method().")
-        if isinstance(attr, classmethod):
+        if kind is _AttrKind.CLASS_METHOD:
             raise TMockPatchingError(f"'{name}' is a classmethod. Use tpatch.class_method().")
-        if isinstance(attr, property):
+        if kind is _AttrKind.PROPERTY:
             raise TMockPatchingError(f"'{name}' is a property. Use tpatch.field().")
-        if not callable(attr):
+        if kind is not _AttrKind.CALLABLE:
             raise TMockPatchingError(f"'{name}' is not callable. Use tpatch.field() or tpatch.class_var().")
 
-        sig = inspect.signature(attr)
-        sig = resolve_forward_refs(attr, sig)
-        params = list(sig.parameters.values())
+        full_sig, sig, is_async = _resolved_signature(attr)
 
-        if not params or params[0].name != "self":
+        if next(iter(full_sig.parameters), None) != "self":
             raise TMockPatchingError(
                 f"'{name}' has no 'self' parameter. "
                 f"Use tpatch.static_method() for static methods or tpatch.function() for functions."
             )
 
-        # Remove 'self' from signature
-        sig = sig.replace(parameters=params[1:])
-        is_async = inspect.iscoroutinefunction(attr)
-
         interceptor = MethodInterceptor(
             name=name,
             signature=sig,
-            class_name=cls.__name__,
+            class_name=cls_name,
             is_async=is_async,
         )
 
-        wrapper = _create_method_wrapper(interceptor, is_async)
+        wrapper = _create_bound_wrapper(interceptor, is_async)
 
-        with mock.patch.object(cls, name, wrapper):
+        with _patch_object(cls, name, wrapper):
             yield interceptor
 
     @staticmethod
@@ -158,31 +151,28 @@ class tpatch:
             with tpatch.static_method(IdGenerator, "generate") as mock:
                 given().call(mock()).returns("fixed-id")
         """
-        if not hasattr(cls, name):
-            raise TMockPatchingError(f"Class '{cls.__name__}' has no attribute '{name}'.")
+        cls_name = cls.__name__
+        kind, attr = _classify_attribute(cls, name)
 
-        attr = inspect.getattr_static(cls, name)
-
-        if not isinstance(attr, staticmethod):
-            if isinstance(attr, classmethod):
+        if kind is _AttrKind.MISSING:
+            raise TMockPatchingError(f"Class '{cls_name}' has no attribute '{name}'.")
+        if kind is not _AttrKind.STATIC_METHOD:
+            if kind is _AttrKind.CLASS_METHOD:
                 raise TMockPatchingError(f"'{name}' is a classmethod, not a staticmethod. Use tpatch.class_method().")
-            if callable(attr):
+            if kind is _AttrKind.CALLABLE:
                 raise TMockPatchingError(f"'{name}' is not a staticmethod. Use tpatch.method() for instance methods.")
             raise TMockPatchingError(f"'{name}' is not a staticmethod.")
 
-        func = attr.__func__
-        sig = inspect.signature(func)
-        sig = resolve_forward_refs(func, sig)
-        is_async = inspect.iscoroutinefunction(func)
+        sig, _, is_async = _resolved_signature(attr.__func__)
 
         interceptor = MethodInterceptor(
             name=name,
             signature=sig,
-            class_name=cls.__name__,
+            class_name=cls_name,
             is_async=is_async,
         )
 
-        with mock.patch.object(cls, name, staticmethod(interceptor)):
+        with _patch_object(cls, name, staticmethod(interceptor)):
             yield interceptor
 
     @staticmethod
@@ -201,40 +191,34 @@ class tpatch:
             with tpatch.class_method(Config, "from_env") as mock:
                 given().call(mock()).returns(Config())
         """
-        if not hasattr(cls, name):
-            raise TMockPatchingError(f"Class '{cls.__name__}' has no attribute '{name}'.")
-
-        attr = inspect.getattr_static(cls, name)
+        cls_name = cls.__name__
+        kind, attr = _classify_attribute(cls, name)
 
-        if not isinstance(attr, classmethod):
-            if isinstance(attr, staticmethod):
+        if kind is _AttrKind.MISSING:
+            raise TMockPatchingError(f"Class '{cls_name}' has no attribute '{name}'.")
+        if kind is not _AttrKind.CLASS_METHOD:
+            if kind is _AttrKind.STATIC_METHOD:
                 raise TMockPatchingError(f"'{name}' is a staticmethod, not a classmethod. Use tpatch.static_method().")
-            if callable(attr):
+            if kind is _AttrKind.CALLABLE:
                 raise TMockPatchingError(f"'{name}' is not a classmethod. Use tpatch.method() for instance methods.")
             raise TMockPatchingError(f"'{name}' is not a classmethod.")
 
-        func = attr.__func__
-        sig = inspect.signature(func)
-        sig = resolve_forward_refs(func, sig)
-        params = list(sig.parameters.values())
+        sig, bound_sig, is_async = _resolved_signature(attr.__func__)
 
         # Remove 'cls' parameter
-        if params and params[0].name in ("cls", "klass", "class_"):
-            params = params[1:]
-        sig = sig.replace(parameters=params)
-
-        is_async = inspect.iscoroutinefunction(func)
+        if next(iter(sig.parameters), None) in ("cls", "klass", "class_"):
+            sig = bound_sig
 
         interceptor = MethodInterceptor(
             name=name,
             signature=sig,
-            class_name=cls.__name__,
+            class_name=cls_name,
             is_async=is_async,
         )
 
-        wrapper = _create_classmethod_wrapper(interceptor, is_async)
+        wrapper = _create_bound_wrapper(interceptor, is_async)
 
-        with mock.patch.object(cls, name, classmethod(wrapper)):
+        with _patch_object(cls, name, classmethod(wrapper)):
             yield interceptor
 
     @staticmethod
@@ -260,51 +244,48 @@ class tpatch:
                 given().get(field).returns("Alice")
                 given().set(field, "Bob").returns(None)
         """
-        # Try FieldDiscovery first
-        fields = FieldDiscovery(cls).discover_all()
+        cls_name = cls.__name__
+        kind, attr = _classify_attribute(cls, name)
 
-        if name in fields:
-            schema = fields[name]
+        if kind is _AttrKind.PROPERTY:
+            # Properties carry their own type info, so discovery is not needed
             getter = GetterInterceptor(
                 name=name,
-                signature=schema.getter_signature,
-                class_name=cls.__name__,
+                signature=_getter_sig_from_property(attr),
+                class_name=cls_name,
             )
             setter = (
                 SetterInterceptor(
                     name=name,
-                    signature=schema.setter_signature,
-                    class_name=cls.__name__,
+                    signature=_setter_sig_from_property(attr),
+                    class_name=cls_name,
                 )
-                if schema.setter_signature
+                if attr.fset
                 else None
             )
         else:
-            # Check if it's a property not discovered (e.g., private or dynamic)
-            attr = inspect.getattr_static(cls, name) if hasattr(cls, name) else None
-
-            if isinstance(attr, property):
-                getter = GetterInterceptor(
-                    name=name,
-                    signature=_getter_sig_from_property(attr),
-                    class_name=cls.__name__,
-                )
-                setter = (
-                    SetterInterceptor(
-                        name=name,
-                        signature=_setter_sig_from_property(attr),
-                        class_name=cls.__name__,
-                    )
-                    if attr.fset
-                    else None
-                )
-            else:
-                available = list(fields.keys()) if fields else []
+            fields = introspect_class(cls).fields
+            if name not in fields:
                 raise TMockPatchingError(
-                    f"'{name}' is not a field on '{cls.__name__}'. "
-                    f"Available fields: {available}. "
+                    f"'{name}' is not a field on '{cls_name}'. "
+                    f"Available fields: {list(fields.keys())}. "
                     f"Use tpatch.class_var() for class variables."
                 )
+            schema = fields[name]
+            getter = GetterInterceptor(
+                name=name,
+                signature=schema.getter_signature,
+                class_name=cls_name,
+            )
+            setter = (
+                SetterInterceptor(
+                    name=name,
+                    signature=schema.setter_signature,
+                    class_name=cls_name,
+                )
+                if schema.setter_signature
+                else None
+            )
 
         field_ref = FieldRef(
             mock=None,
@@ -313,10 +294,14 @@ class tpatch:
             setter_interceptor=setter,
         )
 
-        descriptor = _FieldDescriptor(getter, setter, name, cls.__name__)
+        descriptor: _FieldDescriptor = (
+            _ReadWriteFieldDescriptor(getter, setter)
+            if setter is not None
+            else _ReadOnlyFieldDescriptor(getter, name, cls_name)
+        )
 
         # Use create=True for dataclass/pydantic fields that don't exist as class attributes
-        with mock.patch.object(cls, name, descriptor, create=True):
+        with _patch_object(cls, name, descriptor, create=True):
             yield field_ref
 
     @staticmethod
@@ -337,33 +322,33 @@ class tpatch:
             with tpatch.class_var(Settings, "DEFAULT_TIMEOUT") as field:
                 given().get(field).returns(30)
         """
-        if not hasattr(cls, name):
-            raise TMockPatchingError(f"Class '{cls.__name__}' has no attribute '{name}'.")
+        cls_name = cls.__name__
+        kind, _ = _classify_attribute(cls, name)
 
-        attr = inspect.getattr_static(cls, name)
+        if kind is _AttrKind.MISSING:
+            raise TMockPatchingError(f"Class '{cls_name}' has no attribute '{name}'.")
 
         # Reject things that should use other methods
-        if isinstance(attr, staticmethod):
+        if kind is _AttrKind.STATIC_METHOD:
             raise TMockPatchingError(f"'{name}' is a staticmethod. Use tpatch.static_method().")
-        if isinstance(attr, classmethod):
+        if kind is _AttrKind.CLASS_METHOD:
             raise TMockPatchingError(f"'{name}' is a classmethod. Use tpatch.class_method().")
-        if isinstance(attr, property):
+        if kind is _AttrKind.PROPERTY:
             raise TMockPatchingError(f"'{name}' is a property. Use tpatch.field().")
-        if callable(attr):
+        if kind is _AttrKind.CALLABLE:
             raise TMockPatchingError(f"'{name}' is callable. Use tpatch.method() or tpatch.static_method().")
 
         # Check if it's a discovered field (instance field, not class var)
-        fields = FieldDiscovery(cls).discover_all()
-        if name in fields:
-            raise TMockPatchingError(f"'{name}' is an instance field on '{cls.__name__}'. Use tpatch.field().")
+        if name in introspect_class(cls).fields:
+            raise TMockPatchingError(f"'{name}' is an instance field on '{cls_name}'. Use tpatch.field().")
 
         # Extract type from annotation
         value_type = _get_class_var_type(cls, name)
 
         getter = GetterInterceptor(
             name=name,
-            signature=Signature(return_annotation=value_type),
-            class_name=cls.__name__,
+            signature=build_getter_signature(value_type),
+            class_name=cls_name,
         )
         setter = _UnsupportedSetter(
             name=name,
@@ -377,9 +362,9 @@ class tpatch:
             setter_interceptor=setter,  # type: ignore[arg-type]
         )
 
-        descriptor = _FieldDescriptor(getter, setter, name, cls.__name__)
+        descriptor = _DiscardingFieldDescriptor(getter)
 
-        with mock.patch.object(cls, name, descriptor):
+        with _patch_object(cls, name, descriptor):
             yield field_ref
 
     @staticmethod
@@ -407,19 +392,7 @@ class tpatch:
                 import myapp.app
                 assert myapp.app.DEBUG is True
         """
-        if "." not in path:
-            raise TMockPatchingError(f"Invalid path '{path}'. Expected format: 'module.attribute'.")
-
-        module_path, name = path.rsplit(".", 1)
-        try:
-            module = importlib.import_module(module_path)
-        except ImportError as e:
-            raise TMockPatchingError(f"Cannot import module '{module_path}': {e}")
-
-        if not hasattr(module, name):
-            raise TMockPatchingError(f"Module '{module_path}' has no attribute '{name}'.")
-
-        original = getattr(module, name)
+        module, module_path, name, original = _resolve_path(path)
 
         # Reject callables
         if callable(original):
@@ -431,8 +404,6 @@ class tpatch:
             try:
                 check_type(value, value_type)
             except TypeCheckError as e:
-                from tmock.exceptions import TMockStubbingError
-
                 raise TMockStubbingError(f"Type mismatch for module variable '{name}': {e}") from None
 
         try:
@@ -445,33 +416,105 @@ class tpatch:
 # --- Helpers ---
 
 
-def _create_method_wrapper(interceptor: MethodInterceptor, is_async: bool) -> Any:
-    """Create a wrapper that strips 'self' and delegates to interceptor."""
-    if is_async:
+_MISSING = object()
 
-        async def async_wrapper(self_: Any, *args: Any, **kwargs: Any) -> Any:
-            return await interceptor(*args, **kwargs)
 
-        return async_wrapper
-    else:
+class _AttrKind(Enum):
+    """How a class attribute should be patched."""
 
-        def wrapper(self_: Any, *args: Any, **kwargs: Any) -> Any:
-            return interceptor(*args, **kwargs)
+    MISSING = auto()
+    STATIC_METHOD = auto()
+    CLASS_METHOD = auto()
+    PROPERTY = auto()
+    CALLABLE = auto()
+    VALUE = auto()
 
-        return wrapper
+
+def _classify_attribute(cls: type, name: str) -> tuple[_AttrKind, Any]:
+    """Look up the raw class attribute once and classify it for the tpatch entry points."""
+    attr = inspect.getattr_static(cls, name, _MISSING)
+    if attr is _MISSING:
+        return _AttrKind.MISSING, None
+    if isinstance(attr, staticmethod):
+        return _AttrKind.STATIC_METHOD, attr
+    if isinstance(attr, classmethod):
+        return _AttrKind.CLASS_METHOD, attr
+    if isinstance(attr, property):
+        return _AttrKind.PROPERTY, attr
+    if callable(attr):
+        return _AttrKind.CALLABLE, attr
+    return _AttrKind.VALUE, attr
 
 
-def _create_classmethod_wrapper(interceptor: MethodInterceptor, is_async: bool) -> Any:
-    """Create a wrapper that strips 'cls' and delegates to interceptor."""
+def _resolve_path(path: str) -> tuple[ModuleType, str, str, Any]:
+    """Split a 'module.attribute' path and return (module, module_path, name, current value).
+
+    Modules already in sys.modules are used directly without going through the import machinery.
+    """
+    module_path, sep, name = path.rpartition(".")
+    if not sep:
+        raise TMockPatchingError(f"Invalid path '{path}'. Expected format: 'module.attribute'.")
+
+    module = sys.modules.get(module_path)
+    if module is None:
+        try:
+            module = importlib.import_module(module_path)
+        except ImportError as e:
+            raise TMockPatchingError(f"Cannot import module '{module_path}': {e}")
+
+    original = getattr(module, name, _MISSING)
+    if original is _MISSING:
+        raise TMockPatchingError(f"Module '{module_path}' has no attribute '{name}'.")
+    return module, module_path, name, original
+
+
+# Bounded: a signature can reference the class owning the callable, so entries keep it alive
+_SIGNATURE_CACHE_SIZE = 256
+_SIGNATURE_CACHE: OrderedDict[Callable[..., Any], tuple[Signature, Signature, bool]] = OrderedDict()
+
+
+def _resolved_signature(func: Callable[..., Any]) -> tuple[Signature, Signature, bool]:
+    """Return (signature, signature without its first parameter, is_async) for func, cached per callable.
+
+    Forward references are resolved. The second signature is what a method looks like once
+    'self'/'cls' is bound. Signatures with forward references that cannot be resolved yet are not
+    cached, so they are retried once their target is defined. Unhashable callables are never cached.
+    """
+    try:
+        result = _SIGNATURE_CACHE[func]
+    except (KeyError, TypeError):
+        pass
+    else:
+        _SIGNATURE_CACHE.move_to_end(func)
+        return result
+    sig = resolve_forward_refs(func, inspect.signature(func))
+    bound_sig = sig.replace(parameters=list(sig.parameters.values())[1:])
+    result = (sig, bound_sig, inspect.iscoroutinefunction(func))
+    if not has_unresolved_forward_refs(sig):
+        try:
+            _SIGNATURE_CACHE[func] = result
+        except TypeError:
+            pass
+        else:
+            if len(_SIGNATURE_CACHE) > _SIGNATURE_CACHE_SIZE:
+                _SIGNATURE_CACHE.popitem(last=False)
+    return result
+
+
+def _create_bound_wrapper(interceptor: MethodInterceptor, is_async: bool) -> Any:
+    """Create a wrapper that strips the bound 'self'/'cls' argument and delegates to interceptor.
+
+    The stripped argument is positional-only so that keyword arguments of any name reach the interceptor.
+    """
     if is_async:
 
-        async def async_wrapper(cls_: Any, *args: Any, **kwargs: Any) -> Any:
+        async def async_wrapper(bound_: Any, /, *args: Any, **kwargs: Any) -> Any:
             return await interceptor(*args, **kwargs)
 
         return async_wrapper
     else:
 
-        def wrapper(cls_: Any, *args: Any, **kwargs: Any) -> Any:
+        def wrapper(bound_: Any, /, *args: Any, **kwargs: Any) -> Any:
             return interceptor(*args, **kwargs)
 
         return wrapper
@@ -481,43 +524,36 @@ def _getter_sig_from_property(prop: property) -> Signature:
     """Extract getter signature from a property."""
     if prop.fget:
         try:
-            hints = typing.get_type_hints(prop.fget)
+            hints = get_type_hints(prop.fget)
             return_type = hints.get("return", Any)
         except Exception:
             return_type = Any
     else:
         return_type = Any
-    return Signature(return_annotation=return_type)
+    return build_getter_signature(return_type)
 
 
 def _setter_sig_from_property(prop: property) -> Signature:
     """Extract setter signature from a property."""
     value_type: Any = Any
-    if prop.fset:
+    value_name = setter_value_parameter_name(prop.fset) if prop.fset else None
+    if value_name is not None:
         try:
-            hints = typing.get_type_hints(prop.fset)
-            # Get first non-return hint
-            for param_name, param_type in hints.items():
-                if param_name != "return":
-                    value_type = param_type
-                    break
+            value_type = get_type_hints(prop.fset).get(value_name, Any)
         except Exception:
             pass
-    return Signature(
-        parameters=[Parameter("value", Parameter.POSITIONAL_OR_KEYWORD, annotation=value_type)],
-        return_annotation=type(None),
-    )
+    return build_setter_signature(value_type)
 
 
 def _get_class_var_type(cls: type, name: str) -> Any:
     """Extract type hint for a class variable."""
     try:
-        hints = typing.get_type_hints(cls)
+        hints = get_type_hints(cls)
         if name in hints:
             hint = hints[name]
             # Unwrap ClassVar[T] -> T
-            if typing.get_origin(hint) is ClassVar:
-                args = typing.get_args(hint)
+            if getattr(hint, "__origin__", None) is ClassVar:
+                args = getattr(hint, "__args__", ())
                 return args[0] if args else Any
             return hint
     except Exception:
@@ -528,7 +564,7 @@ def _get_class_var_type(cls: type, name: str) -> Any:
 def _get_module_var_type(module: ModuleType, name: str) -> Any:
     """Extract type hint for a module variable."""
     try:
-        hints = typing.get_type_hints(module)
+        hints = get_type_hints(module)
         if name in hints:
             return hints[name]
     except Exception:
@@ -545,6 +581,8 @@ def _get_module_var_type(module: ModuleType, name: str) -> Any:
 class _UnsupportedSetter:
     """Sentinel for setters that cannot be intercepted due to Python limitations."""
 
+    __slots__ = ("_name", "_reason")
+
     def __init__(self, name: str, reason: str):
         self._name = name
         self._reason = reason
@@ -558,27 +596,52 @@ class _UnsupportedSetter:
 
 
 class _FieldDescriptor:
-    """Descriptor that intercepts field access via getter/setter interceptors."""
-
-    def __init__(
-        self,
-        getter: GetterInterceptor,
-        setter: SetterInterceptor | _UnsupportedSetter | None,
-        name: str,
-        class_name: str,
-    ):
+    """Base descriptor that intercepts field reads via a getter interceptor.
+
+    Subclasses decide how writes are handled, so __set__ never branches on the setter kind.
+    """
+
+    __slots__ = ("_getter",)
+
+    def __init__(self, getter: GetterInterceptor):
         self._getter = getter
-        self._setter = setter
-        self._name = name
-        self._class_name = class_name
 
     def __get__(self, obj: Any, objtype: type | None = None) -> Any:
         return self._getter()
 
+
+class _ReadWriteFieldDescriptor(_FieldDescriptor):
+    """Descriptor that routes writes to a setter interceptor."""
+
+    __slots__ = ("_setter",)
+
+    def __init__(self, getter: GetterInterceptor, setter: SetterInterceptor):
+        super().__init__(getter)
+        self._setter = setter
+
     def __set__(self, obj: Any, value: Any) -> None:
-        if self._setter is None:
-            raise TMockPatchingError(f"Cannot set read-only field '{self._name}' on '{self._class_name}'")
-        if isinstance(self._setter, _UnsupportedSetter):
-            # Discard the write - can't intercept it, don't let it go to original
-            return
         self._setter(value)
+
+
+class _ReadOnlyFieldDescriptor(_FieldDescriptor):
+    """Descriptor that rejects writes to a read-only field."""
+
+    __slots__ = ("_name", "_class_name")
+
+    def __init__(self, getter: GetterInterceptor, name: str, class_name: str):
+        super().__init__(getter)
+        self._name = name
+        self._class_name = class_name
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        raise TMockPatchingError(f"Cannot set read-only field '{self._name}' on '{self._class_name}'")
+
+
+class _DiscardingFieldDescriptor(_FieldDescriptor):
+    """Descriptor for class variables whose writes cannot be intercepted."""
+
+    __slots__ = ()
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        # Discard the write - can't intercept it, don't let it go to original
+        return
@@ -1,28 +1,51 @@
-from typing import Any, Awaitable, TypeVar, overload
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Awaitable, TypeVar, overload
 
 from tmock.call_record import CallRecord
-from tmock.exceptions import TMockStubbingError, TMockVerificationError
-from tmock.field_ref import FieldRef
+from tmock.exceptions import TMockVerificationError
+from tmock.field_ref import capture_field_get, capture_field_set
 from tmock.interceptor import (
+    DslState,
     DslType,
     Interceptor,
     get_dsl_state,
 )
 
-R = TypeVar("R")
+if TYPE_CHECKING:
+    R = TypeVar("R")
+
+_TIMES_MESSAGE = "Expected {call} to be called {n} time(s), but was called {count} time(s)"
+_AT_LEAST_MESSAGE = "Expected {call} to be called at least {n} time(s), but was called {count} time(s)"
+_AT_MOST_MESSAGE = "Expected {call} to be called at most {n} time(s), but was called {count} time(s)"
 
 
 class VerificationBuilder:
     """Builder for configuring verification assertions after .call()."""
 
-    def __init__(self, interceptor: Interceptor, expected: CallRecord):
+    __slots__ = ("_dsl", "_interceptor", "_expected", "_count", "_count_version")
+
+    def __init__(self, dsl: DslState, interceptor: Interceptor, expected: CallRecord):
+        self._dsl = dsl
         self._interceptor = interceptor
         self._expected = expected
-
-    def _get_count(self) -> int:
-        return self._interceptor.count_matching_calls(self._expected)
-
-    def _raise_error(self, default_message: str, custom_message: str | None) -> None:
+        self._count: int | None = None
+        self._count_version = 0
+
+    def _get_count(self, limit: int | None = None) -> int:
+        """Count matching calls, stopping at limit if given (the result is then exact only below limit)."""
+        # Reuse the exact count across terminals on this builder until the interceptor records new calls
+        version = self._interceptor.calls_version
+        if self._count is not None and self._count_version == version:
+            return self._count
+        count = self._interceptor.count_matching_calls(self._expected, limit)
+        if limit is None or count < limit:
+            self._count = count
+            self._count_version = version
+        return count
+
+    def _raise_error(self, template: str, n: int, count: int, custom_message: str | None) -> None:
+        default_message = template.format(call=self._expected.format_call(), n=n, count=count)
         message = default_message
         if custom_message:
             message = f"{custom_message}\nOriginal error: {default_message}"
@@ -30,52 +53,53 @@ class VerificationBuilder:
 
     def called(self, error_message: str | None = None) -> None:
         """Verify the method was called at least once."""
-        self.at_least(1, error_message=error_message)
+        self._dsl.complete()
+        if self._get_count(limit=1) < 1:
+            self._raise_error(_AT_LEAST_MESSAGE, 1, 0, error_message)
 
     def once(self, error_message: str | None = None) -> None:
         """Verify the method was called exactly once."""
-        self.times(1, error_message=error_message)
+        self._dsl.complete()
+        count = self._get_count()
+        if count != 1:
+            self._raise_error(_TIMES_MESSAGE, 1, count, error_message)
 
     def times(self, n: int, error_message: str | None = None) -> None:
         """Verify the method was called exactly n times."""
-        get_dsl_state().complete()
+        self._dsl.complete()
         count = self._get_count()
         if count != n:
-            self._raise_error(
-                f"Expected {self._expected.format_call()} to be called {n} time(s), but was called {count} time(s)",
-                error_message,
-            )
+            self._raise_error(_TIMES_MESSAGE, n, count, error_message)
 
     def never(self, error_message: str | None = None) -> None:
         """Verify the method was never called."""
-        self.times(0, error_message=error_message)
+        self._dsl.complete()
+        if self._get_count(limit=1) > 0:
+            self._raise_error(_TIMES_MESSAGE, 0, self._get_count(), error_message)
 
     def at_least(self, n: int, error_message: str | None = None) -> None:
         """Verify the method was called at least n times."""
-        get_dsl_state().complete()
-        count = self._get_count()
+        self._dsl.complete()
+        # Only the first n matches matter; if fewer exist the count is exact for the error message
+        count = self._get_count(limit=n)
         if count < n:
-            self._raise_error(
-                f"Expected {self._expected.format_call()} to be called at least {n} time(s), "
-                f"but was called {count} time(s)",
-                error_message,
-            )
+            self._raise_error(_AT_LEAST_MESSAGE, n, count, error_message)
 
     def at_most(self, n: int, error_message: str | None = None) -> None:
         """Verify the method was called at most n times."""
-        get_dsl_state().complete()
-        count = self._get_count()
-        if count > n:
-            self._raise_error(
-                f"Expected {self._expected.format_call()} to be called at most {n} time(s), "
-                f"but was called {count} time(s)",
-                error_message,
-            )
+        self._dsl.complete()
+        if self._get_count(limit=n + 1) > n:
+            self._raise_error(_AT_MOST_MESSAGE, n, self._get_count(), error_message)
 
 
 class VerifyBuilder:
     """Builder returned by verify() to capture mock method calls for verification."""
 
+    __slots__ = ("_dsl",)
+
+    def __init__(self, dsl: DslState):
+        self._dsl = dsl
+
     @overload
     def call(self, _: Awaitable[R]) -> VerificationBuilder: ...
 
@@ -88,9 +112,8 @@ class VerifyBuilder:
         Usage:
             verify().call(mock.method(args)).times(n)
         """
-        dsl = get_dsl_state()
-        interceptor, record = dsl.begin_terminal()
-        return VerificationBuilder(interceptor, record)
+        interceptor, record = self._dsl.begin_terminal()
+        return VerificationBuilder(self._dsl, interceptor, record)
 
     def get(self, field_ref: Any) -> VerificationBuilder:
         """Capture a field getter pattern and return a verification builder.
@@ -98,13 +121,8 @@ class VerifyBuilder:
         Usage:
             verify().get(mock.field).once()
         """
-        if not isinstance(field_ref, FieldRef):
-            raise TMockStubbingError("get() expects a field access, e.g. verify().get(mock.field)")
-        dsl = get_dsl_state()
-        # Call the getter interceptor to record the pattern
-        field_ref.getter_interceptor()
-        interceptor, record = dsl.begin_terminal()
-        return VerificationBuilder(interceptor, record)
+        interceptor, record = capture_field_get(self._dsl, field_ref, "verify")
+        return VerificationBuilder(self._dsl, interceptor, record)
 
     def set(self, field_ref: Any, value: Any) -> VerificationBuilder:
         """Capture a field setter pattern and return a verification builder.
@@ -112,15 +130,8 @@ class VerifyBuilder:
         Usage:
             verify().set(mock.field, value).once()
         """
-        if not isinstance(field_ref, FieldRef):
-            raise TMockStubbingError("set() expects a field access, e.g. verify().set(mock.field, value)")
-        if field_ref.setter_interceptor is None:
-            raise TMockStubbingError(f"Field '{field_ref.name}' is read-only and cannot be set")
-        dsl = get_dsl_state()
-        # Call the setter interceptor with the value to record the pattern
-        field_ref.setter_interceptor(value)
-        interceptor, record = dsl.begin_terminal()
-        return VerificationBuilder(interceptor, record)
+        interceptor, record = capture_field_set(self._dsl, field_ref, value, "verify")
+        return VerificationBuilder(self._dsl, interceptor, record)
 
 
 def verify() -> VerifyBuilder:
@@ -136,4 +147,4 @@ def verify() -> VerifyBuilder:
     """
     dsl = get_dsl_state()
     dsl.enter_dsl_mode(DslType.VERIFICATION)
-    return VerifyBuilder()
+    return VerifyBuilder(dsl)
@@ -1,5 +1,7 @@
 from typing import ClassVar, Optional
 
+import pytest
+
 from tmock.class_schema import FieldSource, introspect_class
 
 
@@ -137,3 +139,29 @@ class TestAnnotationPrecedence:
         assert "name" in schema.fields
         # Property takes precedence over annotation
         assert schema.fields["name"].source == FieldSource.PROPERTY
+
+    def test_introspection_is_cached_per_extra_fields(self):
+        class Sample:
+            name: str
+
+        assert introspect_class(Sample) is introspect_class(Sample)
+        with_extra = introspect_class(Sample, extra_fields=["dynamic"])
+        assert with_extra is not introspect_class(Sample)
+        assert "dynamic" in with_extra.fields
+        assert "dynamic" not in introspect_class(Sample).fields
+
+    def test_cached_schema_is_read_only(self):
+        class Sample:
+            name: str
+
+            def run(self) -> None:
+                pass
+
+        schema = introspect_class(Sample)
+
+        with pytest.raises(TypeError):
+            schema.fields["other"] = schema.fields["name"]  # type: ignore[index]
+        with pytest.raises(TypeError):
+            schema.method_signatures["other"] = schema.method_signatures["run"]  # type: ignore[index]
+        with pytest.raises(AttributeError):
+            schema.async_methods.add("run")  # type: ignore[attr-defined]
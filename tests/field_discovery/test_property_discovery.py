@@ -1,4 +1,6 @@
+import functools
 from inspect import Signature
+from typing import Any, Callable
 
 from tmock.class_schema import FieldSource, introspect_class
 
@@ -68,6 +70,33 @@ class TestPropertyDiscovery:
         assert params[0].name == "value"
         assert params[0].annotation is str
 
+    def test_setter_signature_of_wrapped_setter(self):
+        def logged(func: Callable[..., Any]) -> Callable[..., Any]:
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        class Sample:
+            _name: str = ""
+
+            @property
+            def name(self) -> str:
+                return self._name
+
+            @name.setter
+            @logged
+            def name(self, new_name: str) -> None:
+                self._name = new_name
+
+        schema = introspect_class(Sample)
+        field = schema.fields["name"]
+
+        assert field.setter_signature is not None
+        params = list(field.setter_signature.parameters.values())
+        assert params[0].annotation is str
+
     def test_property_defined_as_class_method_not_included(self):
         class Sample:
             @classmethod
@@ -226,3 +226,13 @@ class TestPydanticEdgeCases:
         # Should be discovered as annotation, not pydantic
         assert "name" in schema.fields
         assert schema.fields["name"].source == FieldSource.ANNOTATION
+
+    def test_class_with_pydantic_marker_attr_not_detected_as_pydantic(self):
+        class FakePydantic:
+            __pydantic_complete__ = True
+            model_fields = {"name": "not a FieldInfo"}
+            name: str
+
+        schema = introspect_class(FakePydantic)
+
+        assert schema.fields["name"].source == FieldSource.ANNOTATION
@@ -0,0 +1,47 @@
+import pytest
+
+from tests.field_dsl.fixtures import (
+    GETTER_PERSON_CONFIG_IDS,
+    GETTER_PERSON_CONFIGS,
+    PERSON_CONFIG_IDS,
+    PERSON_CONFIGS,
+    TYPED_GETTER_PERSON_CONFIG_IDS,
+    TYPED_GETTER_PERSON_CONFIGS,
+    TYPED_PERSON_CONFIG_IDS,
+    TYPED_PERSON_CONFIGS,
+    Calculator,
+)
+
+
+@pytest.fixture(params=PERSON_CONFIGS, ids=PERSON_CONFIG_IDS)
+def person_config(request):
+    """Each person class variant, including the extra_fields-only one."""
+    return request.param
+
+
+@pytest.fixture(params=TYPED_PERSON_CONFIGS, ids=TYPED_PERSON_CONFIG_IDS)
+def typed_person_config(request):
+    """Person configs whose fields are discovered with types (excludes extra_fields-only classes)."""
+    return request.param
+
+
+@pytest.fixture(params=GETTER_PERSON_CONFIGS, ids=GETTER_PERSON_CONFIG_IDS)
+def getter_person_config(request):
+    """Person configs for getter tests, including a class with read-only properties."""
+    return request.param
+
+
+@pytest.fixture(params=TYPED_GETTER_PERSON_CONFIGS, ids=TYPED_GETTER_PERSON_CONFIG_IDS)
+def typed_getter_person_config(request):
+    """Getter person configs whose fields are discovered with types."""
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def stubbed_calculator():
+    """A Calculator mock with add(1, 2) stubbed; shared since tests only feed its call results to get()/set()."""
+    from tmock import given, tmock
+
+    mock = tmock(Calculator)
+    given().call(mock.add(1, 2)).returns(3)
+    return mock
@@ -0,0 +1,107 @@
+"""Person class variants shared by the field DSL tests."""
+
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class AnnotatedPerson:
+    name: str
+    age: int
+
+
+@dataclass
+class DataclassPerson:
+    name: str
+    age: int
+
+
+class PropertyPerson:
+    _name: str = ""
+    _age: int = 0
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._name = value
+
+    @property
+    def age(self) -> int:
+        return self._age
+
+    @age.setter
+    def age(self, value: int) -> None:
+        self._age = value
+
+
+class ReadOnlyPropertyPerson:
+    @property
+    def name(self) -> str:
+        return ""
+
+    @property
+    def age(self) -> int:
+        return 0
+
+
+class PydanticPerson(BaseModel):
+    model_config = {"frozen": False}
+    name: str
+    age: int
+
+
+class ExtraFieldsPerson:
+    """A class with fields only defined in __init__, not discoverable by introspection."""
+
+    def __init__(self):
+        self.name = ""
+        self.age = 0
+
+
+@dataclass(frozen=True)
+class FrozenUser:
+    name: str
+
+
+class FrozenPydanticUser(BaseModel):
+    model_config = {"frozen": True}
+    name: str
+
+
+class Calculator:
+    def add(self, a: int, b: int) -> int:
+        return a + b
+
+
+@dataclass(frozen=True, slots=True)
+class PersonConfig:
+    """Configuration for parameterized person class tests."""
+
+    cls: type[Any]
+    extra_fields: list[str] | None = None
+
+
+PERSON_CONFIGS: list[PersonConfig] = [
+    PersonConfig(AnnotatedPerson),
+    PersonConfig(DataclassPerson),
+    PersonConfig(PropertyPerson),
+    PersonConfig(PydanticPerson),
+    PersonConfig(ExtraFieldsPerson, extra_fields=["name", "age"]),
+]
+
+
+PERSON_CONFIG_IDS = [config.cls.__name__ for config in PERSON_CONFIGS]
+
+TYPED_PERSON_CONFIGS = [config for config in PERSON_CONFIGS if config.extra_fields is None]
+TYPED_PERSON_CONFIG_IDS = [config.cls.__name__ for config in TYPED_PERSON_CONFIGS]
+
+# Getters also cover setter-less properties, which the setter tests cannot use
+GETTER_PERSON_CONFIGS: list[PersonConfig] = [*PERSON_CONFIGS, PersonConfig(ReadOnlyPropertyPerson)]
+GETTER_PERSON_CONFIG_IDS = [config.cls.__name__ for config in GETTER_PERSON_CONFIGS]
+
+TYPED_GETTER_PERSON_CONFIGS = [config for config in GETTER_PERSON_CONFIGS if config.extra_fields is None]
+TYPED_GETTER_PERSON_CONFIG_IDS = [config.cls.__name__ for config in TYPED_GETTER_PERSON_CONFIGS]
@@ -19,6 +19,13 @@ class Node:
         return Node()
 
 
+class Tree:
+    """A class with a forward reference nested inside a generic."""
+
+    def children(self) -> list["Tree"]:
+        return []
+
+
 class LinkedList:
     """A class with forward references to another class."""
 
@@ -63,6 +70,13 @@ class AsyncService:
         return Result()
 
 
+class Pending:
+    """A class referencing a name the tests define only later."""
+
+    def make(self) -> "DefinedLater":  # type: ignore[name-defined]  # noqa: F821
+        raise NotImplementedError
+
+
 class Result:
     """Result class for AsyncService."""
 
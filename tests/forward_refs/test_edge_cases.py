@@ -1,5 +1,7 @@
 """Edge cases for forward reference handling."""
 
+import warnings
+
 from tmock import given, tpatch
 
 
@@ -8,3 +10,9 @@ class TestUnresolvableForwardRef:
         """If a forward ref can't be resolved, validation should be skipped."""
         with tpatch.function("tests.forward_refs.fixtures.unresolvable_ref") as mock:
             given().call(mock()).returns("anything")
+
+    def test_skips_validation_without_warning(self) -> None:
+        with tpatch.function("tests.forward_refs.fixtures.unresolvable_ref") as mock:
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                given().call(mock()).returns("anything")
@@ -2,7 +2,8 @@
 
 import pytest
 
-from tests.forward_refs.fixtures import Container, Item, Node
+from tests.forward_refs import fixtures
+from tests.forward_refs.fixtures import Container, Item, Node, Pending
 from tmock import given, tpatch
 from tmock.exceptions import TMockStubbingError
 
@@ -35,3 +36,15 @@ class TestForwardRefParameter:
         with tpatch.method(Container, "add_item") as mock:
             with pytest.raises(TMockStubbingError, match="Invalid type for argument"):
                 given().call(mock("not an item"))
+
+
+class TestForwardRefDefinedLater:
+    def test_resolves_once_target_is_defined(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        with tpatch.method(Pending, "make") as mock:
+            given().call(mock()).returns("anything")
+
+        monkeypatch.setattr(fixtures, "DefinedLater", type("DefinedLater", (), {}), raising=False)
+
+        with tpatch.method(Pending, "make") as mock:
+            with pytest.raises(TMockStubbingError, match="Invalid return type"):
+                given().call(mock()).returns("not DefinedLater")
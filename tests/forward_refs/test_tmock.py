@@ -2,6 +2,7 @@
 
 import pytest
 
+from tests.forward_refs import fixtures
 from tests.forward_refs.fixtures import (
     AsyncService,
     Container,
@@ -9,7 +10,9 @@ from tests.forward_refs.fixtures import (
     LinkedList,
     ListNode,
     Node,
+    Pending,
     Result,
+    Tree,
 )
 from tmock import given, tmock, verify
 from tmock.exceptions import TMockStubbingError
@@ -31,6 +34,22 @@ class TestSelfReferencingReturnType:
             given().call(mock.get_parent()).returns("not a node")  # type: ignore[arg-type]
 
 
+class TestNestedForwardRefReturnType:
+    def test_accepts_valid(self) -> None:
+        mock = tmock(Tree)
+        children = [Tree()]
+
+        given().call(mock.children()).returns(children)
+
+        assert mock.children() is children
+
+    def test_rejects_invalid(self) -> None:
+        mock = tmock(Tree)
+
+        with pytest.raises(TMockStubbingError, match="Invalid return type"):
+            given().call(mock.children()).returns(["not a tree"])  # type: ignore[list-item]
+
+
 class TestForwardRefParameter:
     def test_accepts_valid(self) -> None:
         mock = tmock(Container)
@@ -109,3 +128,14 @@ class TestVerificationWithForwardRefs:
         mock.get_parent()
 
         verify().call(mock.get_parent()).once()
+
+
+class TestForwardRefDefinedLater:
+    def test_resolves_once_target_is_defined(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        given().call(tmock(Pending).make()).returns("anything")
+
+        monkeypatch.setattr(fixtures, "DefinedLater", type("DefinedLater", (), {}), raising=False)
+
+        mock = tmock(Pending)
+        with pytest.raises(TMockStubbingError, match="Invalid return type"):
+            given().call(mock.make()).returns("not DefinedLater")
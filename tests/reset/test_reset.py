@@ -78,6 +78,17 @@ class TestResetInteractions:
         assert mock.greet("Alice") == "Hi Alice"
         assert mock.greet("Bob") == "Hi Bob"
 
+    def test_reused_verification_builder_sees_reset(self):
+        mock = tmock(SampleClass)
+        given().call(mock.greet(any(str))).returns("Hello")
+        mock.greet("Alice")
+        builder = verify().call(mock.greet("Alice"))
+        builder.once()
+
+        reset_interactions(mock)
+
+        builder.never()
+
 
 class TestResetBehaviors:
     def test_reset_behaviors_clears_stubs(self):
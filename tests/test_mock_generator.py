@@ -1,7 +1,9 @@
+from unittest import mock
+
 import pytest
 
 from tmock import given, tmock
-from tmock.exceptions import TMockUnexpectedCallError
+from tmock.exceptions import TMockStubbingError, TMockUnexpectedCallError
 
 
 class TestMockEngine:
@@ -35,3 +37,47 @@ class TestMockEngine:
         with pytest.raises(TMockUnexpectedCallError):
             mocked_sample_class.foo()
         assert capsys.readouterr().out == ""
+
+
+class TestClassChangesAfterMocking:
+    def test_method_added_after_mocking_is_mocked(self):
+        class SampleClass:
+            def foo(self) -> int:
+                return 1
+
+        tmock(SampleClass)
+
+        def bar(self) -> int:
+            return 2
+
+        SampleClass.bar = bar  # type: ignore[attr-defined]
+        mocked = tmock(SampleClass)
+        given().call(mocked.bar()).returns(3)
+
+        assert mocked.bar() == 3
+
+    def test_argument_types_validated_after_plain_patch_is_undone(self):
+        class SampleClass:
+            def foo(self, x: int) -> int:
+                return x
+
+        with mock.patch.object(SampleClass, "foo", lambda self, *args, **kwargs: 0):
+            tmock(SampleClass)
+
+        mocked = tmock(SampleClass)
+        with pytest.raises(TMockStubbingError, match="Invalid type for argument 'x'"):
+            given().call(mocked.foo("wrong"))  # type: ignore[arg-type]
+
+    def test_class_with_unhashable_metaclass(self):
+        class UnhashableMeta(type):
+            def __eq__(cls, other):
+                return cls is other
+
+        class SampleClass(metaclass=UnhashableMeta):
+            def foo(self) -> int:
+                return 1
+
+        mocked = tmock(SampleClass)
+        given().call(mocked.foo()).returns(2)
+
+        assert mocked.foo() == 2
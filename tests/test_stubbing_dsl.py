@@ -38,6 +38,19 @@ class TestStubbingDsl:
         with pytest.raises(TMockUnexpectedCallError):
             mock.foo(3)
 
+    def test_stubbed_argument_matches_same_object_even_if_not_equal_to_itself(self):
+        class SampleClass:
+            def foo(self, x: float) -> str:
+                return ""
+
+        nan = float("nan")
+        mock = tmock(SampleClass)
+        given().call(mock.foo(nan)).returns("same")
+
+        assert mock.foo(nan) == "same"
+        with pytest.raises(TMockUnexpectedCallError):
+            mock.foo(float("nan"))
+
     def test_later_stub_overrides_earlier_for_same_args(self):
         class SampleClass:
             def foo(self, x: int) -> str:
@@ -10,8 +10,8 @@ from tests.tpatch.field.fixtures import (
     PropertyPerson,
     PydanticUser,
 )
-from tmock import given, tpatch, verify
-from tmock.exceptions import TMockPatchingError
+from tmock import given, tmock, tpatch, verify
+from tmock.exceptions import TMockPatchingError, TMockStubbingError
 
 
 class TestDataclassFieldPatching:
@@ -195,6 +195,14 @@ class TestTypeValidation:
             with pytest.raises(Exception):  # TMockStubbingError
                 given().set(field, "not an int").returns(None)
 
+    def test_tmock_after_patch_validates_property_type(self) -> None:
+        with tpatch.field(PropertyPerson, "name"):
+            tmock(PropertyPerson)
+
+        mock = tmock(PropertyPerson)
+        with pytest.raises(TMockStubbingError, match="Invalid return type for name"):
+            given().get(mock.name).returns(123)
+
 
 class TestErrorHandling:
     def test_raises_on_nonexistent_field(self) -> None:
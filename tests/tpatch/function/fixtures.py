@@ -1,5 +1,8 @@
 """Fixtures for tpatch.function tests."""
 
+import inspect
+from typing import Any
+
 
 def standalone_function(x: int, y: str) -> str:
     """A regular function."""
@@ -14,3 +17,30 @@ async def async_standalone_function(x: int) -> str:
 def function_with_defaults(a: int, b: str = "default", c: bool = True) -> str:
     """Function with default arguments."""
     return f"{a}-{b}-{c}"
+
+
+def function_with_explicit_signature(*args: Any, **kwargs: Any) -> Any:
+    """Function whose public signature is declared via __signature__."""
+    return "original"
+
+
+function_with_explicit_signature.__signature__ = inspect.Signature(  # type: ignore[attr-defined]
+    parameters=[inspect.Parameter("x", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=int)],
+    return_annotation=str,
+)
+
+
+class ServiceWithExplicitSignature:
+    def get(self, *args: Any, **kwargs: Any) -> Any:
+        return "original"
+
+    get.__signature__ = inspect.Signature(  # type: ignore[attr-defined]
+        parameters=[
+            inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD),
+            inspect.Parameter("key", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=str),
+        ],
+        return_annotation=str,
+    )
+
+
+bound_method_with_explicit_signature = ServiceWithExplicitSignature().get
@@ -6,7 +6,7 @@ from tests.tpatch.function import fixtures
 from tests.tpatch.function import importer as importer_module
 from tests.tpatch.function.fixtures import standalone_function
 from tmock import given, tpatch, verify
-from tmock.exceptions import TMockPatchingError
+from tmock.exceptions import TMockPatchingError, TMockStubbingError
 
 
 class TestBasicFunctionPatching:
@@ -159,6 +159,30 @@ class TestTypeValidation:
             with pytest.raises(Exception):  # TMockStubbingError
                 given().call(mock(1, "hello")).returns(123)  # Should return str
 
+    def test_validates_types_when_patching_same_function_again(self) -> None:
+        with tpatch.function("tests.tpatch.function.fixtures.standalone_function") as mock:
+            given().call(mock(1, "hello")).returns("first")
+
+        with tpatch.function("tests.tpatch.function.fixtures.standalone_function") as mock:
+            with pytest.raises(TMockStubbingError, match="Invalid return type"):
+                given().call(mock(1, "hello")).returns(123)
+
+    def test_uses_explicit_signature_attribute(self) -> None:
+        with tpatch.function("tests.tpatch.function.fixtures.function_with_explicit_signature") as mock:
+            given().call(mock(1)).returns("mocked")
+
+            assert fixtures.function_with_explicit_signature(1) == "mocked"
+            with pytest.raises(TMockStubbingError, match="Invalid type for argument 'x'"):
+                given().call(mock("wrong"))
+
+    def test_bound_method_excludes_self_from_explicit_signature(self) -> None:
+        with tpatch.function("tests.tpatch.function.fixtures.bound_method_with_explicit_signature") as mock:
+            given().call(mock("k")).returns("mocked")
+
+            assert fixtures.bound_method_with_explicit_signature("k") == "mocked"
+            with pytest.raises(TMockStubbingError, match="Invalid type for argument 'key'"):
+                given().call(mock(1))  # type: ignore[arg-type]
+
 
 class TestErrorHandling:
     def test_raises_on_invalid_path_format(self) -> None:
@@ -3,8 +3,8 @@
 import pytest
 
 from tests.tpatch.method.fixtures import Calculator, ServiceWithDeps
-from tmock import given, tpatch, verify
-from tmock.exceptions import TMockPatchingError
+from tmock import given, tmock, tpatch, verify
+from tmock.exceptions import TMockPatchingError, TMockStubbingError
 
 
 class TestBasicMethodPatching:
@@ -125,6 +125,25 @@ class TestTypeValidation:
             with pytest.raises(Exception):  # TMockStubbingError
                 given().call(mock(1, 2)).returns("should be int")
 
+    def test_tmock_after_patch_validates_argument_types(self) -> None:
+        with tpatch.method(Calculator, "add"):
+            tmock(Calculator)
+
+        mock = tmock(Calculator)
+        with pytest.raises(TMockStubbingError, match="Invalid type for argument 'a'"):
+            given().call(mock.add("wrong", 2))  # type: ignore[arg-type]
+
+    def test_tmock_of_subclass_after_patch_validates_argument_types(self) -> None:
+        class ScientificCalculator(Calculator):
+            pass
+
+        with tpatch.method(Calculator, "add"):
+            tmock(ScientificCalculator)
+
+        mock = tmock(ScientificCalculator)
+        with pytest.raises(TMockStubbingError, match="Invalid type for argument 'a'"):
+            given().call(mock.add("wrong", 2))  # type: ignore[arg-type]
+
 
 class TestErrorHandling:
     def test_raises_on_nonexistent_method(self) -> None:
@@ -156,6 +156,14 @@ class TestVerifyAtMost:
         with pytest.raises(TMockVerificationError):
             verify().call(mock.add(1, 2)).at_most(2)
 
+    def test_at_most_error_reports_total_count(self):
+        mock = tmock(Calculator)
+        given().call(mock.add(any(int), any(int))).returns(0)
+        for _ in range(5):
+            mock.add(1, 2)
+        with pytest.raises(TMockVerificationError, match=r"at most 1 time\(s\), but was called 5 time\(s\)"):
+            verify().call(mock.add(1, 2)).at_most(1)
+
     def test_at_most_zero_same_as_never(self):
         mock = tmock(Calculator)
         verify().call(mock.add(1, 2)).at_most(0)
@@ -305,6 +313,17 @@ class TestVerifyEdgeCases:
         verify().call(mock.add(3, 3)).once()
         verify().call(mock.add(4, 4)).never()
 
+    def test_reused_builder_sees_calls_made_after_first_terminal(self):
+        mock = tmock(Calculator)
+        given().call(mock.add(any(int), any(int))).returns(0)
+        mock.add(1, 2)
+        builder = verify().call(mock.add(1, 2))
+        builder.once()
+
+        mock.add(1, 2)
+
+        builder.times(2)
+
 
 class TestIncompleteVerificationDetection:
     """Tests that incomplete verify().call() calls are detected and raise errors."""